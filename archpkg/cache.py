@@ -0,0 +1,184 @@
+# cache.py
+"""Small on-disk cache for values that are expensive to recompute between CLI runs."""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+from archpkg.config import PACKAGE_DB_PATHS, SEARCH_CACHE
+from archpkg.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+def get_cache_directory() -> Path:
+    """Get the appropriate cache directory for the current platform.
+
+    Returns:
+        Path: Cache directory (not guaranteed to exist yet)
+    """
+    if sys.platform == 'win32':
+        base_dir = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+        return base_dir / 'archpkg-helper' / 'cache'
+
+    xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / 'archpkg-helper'
+    return Path.home() / '.cache' / 'archpkg-helper'
+
+def read_cache(name: str, key: Any) -> Optional[Any]:
+    """Read a cached value if it was stored under the same key.
+
+    Args:
+        name: Cache entry name (used as the file name)
+        key: JSON-serializable validity key, e.g. a source file's mtime
+
+    Returns:
+        Optional[Any]: Cached value, or None on a miss, stale key or unreadable entry
+    """
+    cache_file = get_cache_directory() / f"{name}.json"
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        logger.debug(f"Cache miss for '{name}': no cache file")
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable cache file {cache_file}: {e}")
+        return None
+
+    if not isinstance(entry, dict) or entry.get('key') != key:
+        logger.debug(f"Cache miss for '{name}': stale key")
+        return None
+
+    logger.debug(f"Cache hit for '{name}'")
+    return entry.get('value')
+
+def write_cache(name: str, key: Any, value: Any) -> None:
+    """Store a value in the cache; failures are logged and otherwise ignored.
+
+    Args:
+        name: Cache entry name (used as the file name)
+        key: JSON-serializable validity key checked by read_cache
+        value: JSON-serializable value to store
+    """
+    cache_dir = get_cache_directory()
+    cache_file = cache_dir / f"{name}.json"
+    tmp_file = cache_dir / f".{name}.json.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'value': value}, f)
+        # Atomic rename so concurrent runs never see a half-written entry
+        os.replace(tmp_file, cache_file)
+        logger.debug(f"Stored cache entry '{name}' in {cache_file}")
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write cache file {cache_file}: {e}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+def get_latest_mtime(paths: List[str]) -> Optional[float]:
+    """Get the latest modification time across paths.
+
+    Directories contribute their own mtime and that of their direct entries
+    (not recursive), which is where package managers keep their databases.
+
+    Args:
+        paths: Files or directories to inspect
+
+    Returns:
+        Optional[float]: Latest mtime, or None if none of the paths exist
+    """
+    latest = None
+    for path in paths:
+        try:
+            mtimes = [os.stat(path).st_mtime]
+            if os.path.isdir(path):
+                with os.scandir(path) as entries:
+                    mtimes.extend(entry.stat().st_mtime for entry in entries)
+        except OSError:
+            continue
+        latest = max(mtimes) if latest is None else max(latest, *mtimes)
+    return latest
+
+def get_search_cache_name(source: str, query: str) -> str:
+    """Get the cache entry name for one source's results for one query.
+
+    Each query gets its own small file, so a lookup only parses the results
+    it needs and a store never rewrites other queries' results.
+
+    Args:
+        source: Package source (key of PACKAGE_DB_PATHS)
+        query: Search query string
+
+    Returns:
+        str: Cache entry name
+    """
+    digest = hashlib.sha256(query.strip().encode('utf-8')).hexdigest()[:16]
+    return f"search-{source}-{digest}"
+
+def prune_search_cache(source: str) -> None:
+    """Delete all but the most recently written search cache files of a source.
+
+    Args:
+        source: Package source (key of PACKAGE_DB_PATHS)
+    """
+    entries = []
+    for cache_file in get_cache_directory().glob(f"search-{source}-*.json"):
+        try:
+            entries.append((cache_file.stat().st_mtime, cache_file))
+        except OSError:
+            continue
+
+    entries.sort(reverse=True)
+    for _, cache_file in entries[SEARCH_CACHE['max_queries']:]:
+        try:
+            cache_file.unlink()
+            logger.debug(f"Pruned old search cache file {cache_file}")
+        except OSError as e:
+            logger.debug(f"Could not prune search cache file {cache_file}: {e}")
+
+def load_search_results(source: str, query: str) -> Optional[List[Tuple[str, str, str]]]:
+    """Load cached search results for a native package manager query.
+    
+    Args:
+        source: Package source (key of PACKAGE_DB_PATHS)
+        query: Search query string
+        
+    Returns:
+        Optional[List[Tuple[str, str, str]]]: Cached results (possibly empty), or None on a miss
+    """
+    db_mtime = get_latest_mtime(PACKAGE_DB_PATHS.get(source, []))
+    if db_mtime is None:
+        return None
+
+    entry = read_cache(get_search_cache_name(source, query), db_mtime)
+    if (not isinstance(entry, dict) or entry.get('query') != query.strip()
+            or not isinstance(entry.get('results'), list)):
+        return None
+    if time.time() - entry.get('created', 0) > SEARCH_CACHE['ttl']:
+        logger.debug(f"Cached {source} results for '{query}' expired")
+        return None
+
+    logger.info(f"Using cached {source} results for query: '{query}'")
+    return [tuple(pkg) for pkg in entry['results']]
+
+def store_search_results(source: str, query: str, results: List[Tuple[str, str, str]]) -> None:
+    """Cache search results for a native package manager query.
+    
+    Args:
+        source: Package source (key of PACKAGE_DB_PATHS)
+        query: Search query string
+        results: List of (name, description, source) tuples; empty results are cached too
+    """
+    db_mtime = get_latest_mtime(PACKAGE_DB_PATHS.get(source, []))
+    if db_mtime is None:
+        return
+
+    entry = {'query': query.strip(), 'created': time.time(), 'results': results}
+    write_cache(get_search_cache_name(source, query), db_mtime, entry)
+    prune_search_cache(source)
@@ -3,89 +3,187 @@
 """Universal Package Helper CLI - Main module with improved consistency."""
 
 import argparse
-import sys
+import heapq
+import importlib
 import os
-import webbrowser
-from typing import List, Tuple, Optional
+import re
+import shlex
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, FrozenSet, List, NamedTuple, Tuple, Optional, Union
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 import logging
 
 # Import modules
-from archpkg.config import JUNK_KEYWORDS, LOW_PRIORITY_KEYWORDS, BOOST_KEYWORDS, DISTRO_MAP
+from archpkg.config import JUNK_KEYWORDS, LOW_PRIORITY_KEYWORDS, BOOST_KEYWORDS, SOURCE_PRIORITY, DISTRO_MAP, TIMEOUTS
 from archpkg.exceptions import PackageManagerNotFound, NetworkError, TimeoutError
-from archpkg.search_aur import search_aur
-from archpkg.search_pacman import search_pacman
-from archpkg.search_flatpak import search_flatpak
-from archpkg.search_snap import search_snap
-from archpkg.search_apt import search_apt
-from archpkg.search_dnf import search_dnf
 from archpkg.command_gen import generate_command
 from archpkg.logging_config import get_logger, PackageHelperLogger
 
 console = Console()
 logger = get_logger(__name__)
 
-# Dependency check for `distro`
-try:
-    import distro
-    logger.info("Successfully imported distro module")
-except ModuleNotFoundError as e:
-    logger.error(f"Required dependency 'distro' is not installed: {e}")
-    console.print(Panel(
-        "[red]Required dependency 'distro' is not installed.[/red]\n\n"
-        "[bold yellow]To fix this issue:[/bold yellow]\n"
-        "- Run: [cyan]pip install distro[/cyan]\n"
-        "- Or reinstall the package: [cyan]pip install --upgrade archpkg-helper[/cyan]\n"
-        "- If using pipx: [cyan]pipx reinstall archpkg-helper[/cyan]",
-        title="Missing Dependency",
-        border_style="red"
-    ))
-    sys.exit(1)
+# Search backends as (module, function); imported on first use so a run only
+# loads the backends for its distro (e.g. Debian never imports requests/AUR)
+SEARCH_BACKENDS = {
+    "aur": ("archpkg.search_aur", "search_aur"),
+    "pacman": ("archpkg.search_pacman", "search_pacman"),
+    "apt": ("archpkg.search_apt", "search_apt"),
+    "dnf": ("archpkg.search_dnf", "search_dnf"),
+    "flatpak": ("archpkg.search_flatpak", "search_flatpak"),
+    "snap": ("archpkg.search_snap", "search_snap"),
+}
+
+def load_search_backend(source: str) -> Callable[[str], List[Tuple[str, str, str]]]:
+    """Import and return the search function for a package source.
+    
+    Args:
+        source: Package source name (key of SEARCH_BACKENDS)
+        
+    Returns:
+        Callable[[str], List[Tuple[str, str, str]]]: The backend's search function
+    """
+    module_name, function_name = SEARCH_BACKENDS[source]
+    return getattr(importlib.import_module(module_name), function_name)
+
+def keyword_alternation(keywords: List[str]) -> str:
+    """Build a regex alternation matching any of the keywords as a substring.
+    
+    An empty keyword list matches nothing, as the old any() checks did,
+    rather than the empty string at every position. Empty-string keywords
+    are ignored. This is a deliberate change: the old substring checks
+    treated '' as present in every text, so one '' flagged every package.
+    
+    Args:
+        keywords: Lowercase keywords to match as substrings
+        
+    Returns:
+        str: Regex alternation, or a never-matching pattern if there are no keywords
+    """
+    escaped = [re.escape(keyword) for keyword in keywords if keyword]
+    return "|".join(escaped) if escaped else "(?!)"
+
+def compile_keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile a keyword list into a single alternation scanned in one pass.
+    
+    The alternation is wrapped in a lookahead so overlapping keywords
+    (e.g. 'gui' and 'ide' in 'guide') are all reported by findall, as long
+    as they start at different positions: at any one position only the
+    first matching alternative is reported.
+    
+    Args:
+        keywords: Lowercase keywords to match as substrings
+        
+    Returns:
+        re.Pattern[str]: Compiled pattern whose findall yields matched keywords
+    """
+    return re.compile("(?=(" + keyword_alternation(keywords) + "))")
+
+JUNK_PATTERN = compile_keyword_pattern(JUNK_KEYWORDS)
+
+# Boost and low-priority keywords share one pattern; the named group that
+# matched tells which class a hit belongs to
+KEYWORD_WEIGHTS = {"boost": 3, "low": -10}
+KEYWORD_GROUPS = (("boost", BOOST_KEYWORDS), ("low", LOW_PRIORITY_KEYWORDS))
+KEYWORD_SCORE_PATTERN = re.compile(
+    "(?=(?P<boost>" + keyword_alternation(BOOST_KEYWORDS) + ")"
+    "|(?P<low>" + keyword_alternation(LOW_PRIORITY_KEYWORDS) + "))"
+)
+
+# The pattern reports only one keyword per position, so keywords that are
+# prefixes of one another (e.g. 'plug' and 'plugin', within or across the
+# lists) would hide each other. For every keyword, these are the others
+# that can start where it does and must be checked at its match position.
+# Empty for prefix-free lists, which the shipped config.py lists are.
+KEYWORD_OVERLAPS = {
+    (group, word): tuple(
+        (other_group, other)
+        for other_group, others in KEYWORD_GROUPS
+        for other in others
+        if other and (other_group, other) != (group, word)
+        and (other.startswith(word) or word.startswith(other))
+    )
+    for group, words in KEYWORD_GROUPS
+    for word in words
+    if word
+}
+
+OS_RELEASE_PATH = "/etc/os-release"
+
+def read_os_release_id(path: str = OS_RELEASE_PATH) -> Optional[str]:
+    """Read the ID field from an os-release file.
+    
+    Args:
+        path: Path of the os-release file
+        
+    Returns:
+        Optional[str]: Lowercased distribution ID, or None if unreadable or absent
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('ID='):
+                    # Same normalization as distro.id(): lowercase, spaces to underscores
+                    dist = line[3:].strip().strip('"\'').lower().replace(' ', '_')
+                    return dist or None
+    except (OSError, UnicodeDecodeError) as e:
+        logger.debug(f"Cannot read {path}: {e}")
+    return None
+
+def get_distro_id() -> str:
+    """Get the raw distribution ID.
+    
+    The ID is parsed straight from /etc/os-release; the 'distro' package
+    is only a fallback for systems without one.
+    
+    Returns:
+        str: Lowercased distribution ID (may be empty if undetectable)
+    """
+    dist = read_os_release_id()
+    if dist:
+        return dist
 
+    # Fallback for systems without a usable os-release (imported lazily:
+    # the 'distro' package is otherwise never loaded)
+    logger.debug(f"No ID in {OS_RELEASE_PATH}, falling back to the distro module")
+    try:
+        import distro
+        logger.info("Successfully imported distro module")
+    except ModuleNotFoundError as e:
+        logger.error(f"Required dependency 'distro' is not installed: {e}")
+        console.print(Panel(
+            "[red]Required dependency 'distro' is not installed.[/red]\n\n"
+            "[bold yellow]To fix this issue:[/bold yellow]\n"
+            "- Run: [cyan]pip install distro[/cyan]\n"
+            "- Or reinstall the package: [cyan]pip install --upgrade archpkg-helper[/cyan]\n"
+            "- If using pipx: [cyan]pipx reinstall archpkg-helper[/cyan]",
+            title="Missing Dependency",
+            border_style="red"
+        ))
+        sys.exit(1)
+
+    return distro.id().lower().strip()
+
+@lru_cache(maxsize=1)
 def detect_distro() -> str:
     """Detect the current Linux distribution with detailed error handling.
     
+    The result is memoized for the lifetime of the process, so repeated
+    calls (and their warning panels) happen only once.
+    
     Returns:
         str: Detected distribution family ('arch', 'debian', 'fedora', or 'unknown')
     """
     logger.info("Starting distribution detection")
     
+    # Only the lookup itself can fail; mapping the ID to a family cannot
     try:
-        dist = distro.id().lower().strip()
-        logger.debug(f"Raw distribution ID: '{dist}'")
-        
-        if not dist:
-            logger.warning("Empty distribution ID detected")
-            console.print(Panel(
-                "[yellow]Unable to detect your Linux distribution.[/yellow]\n\n"
-                "[bold cyan]Possible solutions:[/bold cyan]\n"
-                "- Ensure you're running on a supported Linux distribution\n"
-                "- Check if the /etc/os-release file exists\n"
-                "- Try running: [cyan]cat /etc/os-release[/cyan]",
-                title="Distribution Detection Warning",
-                border_style="yellow"
-            ))
-            return "unknown"
-        
-        detected_family = DISTRO_MAP.get(dist, "unknown")
-        logger.info(f"Detected distribution: '{dist}' -> family: '{detected_family}'")
-        
-        if detected_family == "unknown":
-            logger.warning(f"Unsupported distribution detected: '{dist}'")
-            console.print(Panel(
-                f"[yellow]Unsupported distribution detected: '{dist}'[/yellow]\n\n"
-                "[bold cyan]What you can do:[/bold cyan]\n"
-                "- Only Flatpak and Snap searches will be available\n"
-                "- Consider requesting support for your distribution\n"
-                f"- Supported distributions: {', '.join(DISTRO_MAP.keys())}",
-                title="Unsupported Distribution",
-                border_style="yellow"
-            ))
-        
-        return detected_family
-        
+        dist = get_distro_id()
     except Exception as e:
         PackageHelperLogger.log_exception(logger, "Failed to detect distribution", e)
         console.print(Panel(
@@ -101,10 +199,42 @@ def detect_distro() -> str:
         ))
         return "unknown"
     
+    logger.debug(f"Raw distribution ID: '{dist}'")
+    
+    if not dist:
+        logger.warning("Empty distribution ID detected")
+        console.print(Panel(
+            "[yellow]Unable to detect your Linux distribution.[/yellow]\n\n"
+            "[bold cyan]Possible solutions:[/bold cyan]\n"
+            "- Ensure you're running on a supported Linux distribution\n"
+            "- Check if the /etc/os-release file exists\n"
+            "- Try running: [cyan]cat /etc/os-release[/cyan]",
+            title="Distribution Detection Warning",
+            border_style="yellow"
+        ))
+        return "unknown"
+    
+    detected_family = DISTRO_MAP.get(dist, "unknown")
+    logger.info(f"Detected distribution: '{dist}' -> family: '{detected_family}'")
+    
+    if detected_family == "unknown":
+        logger.warning(f"Unsupported distribution detected: '{dist}'")
+        console.print(Panel(
+            f"[yellow]Unsupported distribution detected: '{dist}'[/yellow]\n\n"
+            "[bold cyan]What you can do:[/bold cyan]\n"
+            "- Only Flatpak and Snap searches will be available\n"
+            "- Consider requesting support for your distribution\n"
+            f"- Supported distributions: {', '.join(DISTRO_MAP.keys())}",
+            title="Unsupported Distribution",
+            border_style="yellow"
+        ))
+    
+    return detected_family
+    
 def is_valid_package(name: str, desc: Optional[str]) -> bool:
     """Check if a package is valid (not junk/meta package)."""
     desc = (desc or "").lower()
-    is_junk = any(bad in desc for bad in JUNK_KEYWORDS)
+    is_junk = JUNK_PATTERN.search(desc) is not None
     
     if is_junk:
         logger.debug(f"Package '{name}' filtered out as junk package")
@@ -123,102 +253,164 @@ def deduplicate_packages(packages: List[Tuple[str, str, str]], prefer_aur: bool
     """
     logger.debug(f"Deduplicating {len(packages)} packages, prefer_aur={prefer_aur}")
     
-    
-    package_groups = {}
-    for name, desc, source in packages:
-        if name not in package_groups:
-            package_groups[name] = []
-        package_groups[name].append((name, desc, source))
-    
-    deduplicated = []
-    for name, group in package_groups.items():
-        if len(group) == 1:
-            deduplicated.append(group[0])
-        else:
-            sources = [source for _, _, source in group]
-            
-            if prefer_aur and 'aur' in sources:
-                preferred = next((pkg for pkg in group if pkg[2] == 'aur'), group[0])
-                logger.debug(f"Package '{name}' available in multiple sources, preferring AUR")
-            elif 'pacman' in sources:
-                preferred = next((pkg for pkg in group if pkg[2] == 'pacman'), group[0])
-                logger.debug(f"Package '{name}' available in multiple sources, preferring Pacman")
-            else:
-                preferred = group[0]
-                logger.debug(f"Package '{name}' available in multiple sources, using first: {preferred[2]}")
-            
-            deduplicated.append(preferred)
+    # Higher rank wins; ties keep the first occurrence
+    source_rank = {'aur': 2 if prefer_aur else 0, 'pacman': 1}
+
+    # Single pass: dicts keep first-seen order even when a value is replaced
+    best = {}
+    for pkg in packages:
+        name, _, source = pkg
+        rank = source_rank.get(source, 0)
+        current = best.get(name)
+        if current is None:
+            best[name] = (pkg, rank)
+        elif rank > current[1]:
+            logger.debug(f"Package '{name}' available in multiple sources, preferring {source}")
+            best[name] = (pkg, rank)
+
+    deduplicated = [pkg for pkg, _ in best.values()]
     
     logger.info(f"Deduplicated {len(packages)} packages to {len(deduplicated)} unique packages")
     return deduplicated
 
-def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit: int = 5) -> List[Tuple[str, str, str]]:
-    """Get top matching packages with improved scoring algorithm."""
+def count_prefix_hits(tokens: FrozenSet[str], query_tokens: FrozenSet[str], prefix_lengths: Tuple[int, ...]) -> int:
+    """Count (query token, token) pairs where the token starts with the query token.
+    
+    Instead of probing every query token against every token with startswith,
+    each token's prefixes are looked up in the query token set, one lookup per
+    distinct query token length.
+    
+    Args:
+        tokens: Tokens of a package name or description
+        query_tokens: Lowercased query tokens
+        prefix_lengths: Distinct query token lengths, sorted ascending
+        
+    Returns:
+        int: Number of prefix hits
+    """
+    hits = 0
+    for token in tokens:
+        token_len = len(token)
+        for length in prefix_lengths:
+            if length > token_len:
+                break
+            if token[:length] in query_tokens:
+                hits += 1
+    return hits
+
+def tokenize_package(name: str, desc: Optional[str]) -> Tuple[str, str, FrozenSet[str], FrozenSet[str]]:
+    """Normalize a package's name and description for scoring.
+    
+    Args:
+        name: Package name
+        desc: Package description, if any
+        
+    Returns:
+        Tuple[str, str, FrozenSet[str], FrozenSet[str]]: (lowercased name, lowercased description,
+        name tokens, description tokens)
+    """
+    name_l = name.lower()
+    desc_l = (desc or "").lower()
+    return name_l, desc_l, frozenset(name_l.replace("-", " ").split()), frozenset(desc_l.split())
+
+class QueryProfile(NamedTuple):
+    """Normalized form of a search query, computed once per search."""
+    lower: str
+    tokens: FrozenSet[str]
+    prefix_lengths: Tuple[int, ...]
+
+def build_query_profile(query: str) -> QueryProfile:
+    """Normalize a search query for scoring.
+    
+    Args:
+        query: Raw search query
+        
+    Returns:
+        QueryProfile: Lowercased query, its tokens and their distinct lengths
+    """
+    lower = query.lower()
+    tokens = frozenset(lower.split())
+    return QueryProfile(lower, tokens, tuple(sorted({len(q) for q in tokens})))
+
+def score_package(name: str, desc: Optional[str], source: str, query: str,
+                  query_tokens: FrozenSet[str], prefix_lengths: Tuple[int, ...]) -> int:
+    """Score a single package against a normalized query.
+    
+    Args:
+        name: Package name
+        desc: Package description, if any
+        source: Package source (pacman, aur, flatpak, etc.)
+        query: Lowercased search query
+        query_tokens: Lowercased query tokens
+        prefix_lengths: Distinct query token lengths, sorted ascending
+        
+    Returns:
+        int: Relevance score (higher is better)
+    """
+    name_l, desc_l, name_tokens, desc_tokens = tokenize_package(name, desc)
+
+    score = 0
+
+    if query == name_l:
+        score += 150
+        logger.debug(f"Exact match bonus for '{name}': +150")
+    elif query in name_l:
+        score += 80
+        logger.debug(f"Substring match bonus for '{name}': +80")
+
+    score += 4 * count_prefix_hits(name_tokens, query_tokens, prefix_lengths)
+    score += count_prefix_hits(desc_tokens, query_tokens, prefix_lengths)
+
+    # Boost keywords / penalize low priority: one pass over name and
+    # description (the separator keeps matches from spanning both); each
+    # distinct keyword counts once
+    text = name_l + "\x1f" + desc_l
+    keyword_hits = set()
+    for match in KEYWORD_SCORE_PATTERN.finditer(text):
+        hit = (match.lastgroup, match.group(match.lastgroup))
+        keyword_hits.add(hit)
+        for other in KEYWORD_OVERLAPS[hit]:
+            if text.startswith(other[1], match.start()):
+                keyword_hits.add(other)
+    score += sum(KEYWORD_WEIGHTS[group] for group, _ in keyword_hits)
+
+    if name_l.endswith("-bin"):
+        score += 5
+
+    # Source priority (IMPROVED: consistent scoring)
+    score += SOURCE_PRIORITY.get(source.lower(), 0)
+
+    return score
+
+def get_top_matches(query: Union[str, QueryProfile], all_packages: List[Tuple[str, str, str]],
+                    limit: int = 5) -> List[Tuple[str, str, str]]:
+    """Get top matching packages with improved scoring algorithm.
+
+    Accepts either a raw query or a QueryProfile built with build_query_profile.
+    """
+    profile = query if isinstance(query, QueryProfile) else build_query_profile(query)
+    query, query_tokens, prefix_lengths = profile
     logger.debug(f"Scoring {len(all_packages)} packages for query: '{query}'")
     
     if not all_packages:
         logger.debug("No packages to score")
         return []
-        
-    query = query.lower()
-    query_tokens = set(query.split())
-    scored_results = []
-
-    for name, desc, source in all_packages:
-        if not is_valid_package(name, desc):
-            continue
-
-        name_l = name.lower()
-        desc_l = (desc or "").lower()
-        name_tokens = set(name_l.replace("-", " ").split())
-        desc_tokens = set(desc_l.split())
-
-        score = 0
-
-        if query == name_l:
-            score += 150
-            logger.debug(f"Exact match bonus for '{name}': +150")
-        elif query in name_l:
-            score += 80
-            logger.debug(f"Substring match bonus for '{name}': +80")
-
-        for q in query_tokens:
-            for token in name_tokens:
-                if token.startswith(q):
-                    score += 4
-            for token in desc_tokens:
-                if token.startswith(q):
-                    score += 1
-
-        # Boost keywords
-        for word in BOOST_KEYWORDS:
-            if word in name_l or word in desc_l:
-                score += 3
-
-        # Penalize low priority
-        for bad in LOW_PRIORITY_KEYWORDS:
-            if bad in name_l or bad in desc_l:
-                score -= 10
-
-        if name_l.endswith("-bin"):
-            score += 5
-
-        # Source priority (IMPROVED: consistent scoring)
-        source_priority = {
-            "pacman": 40, "apt": 40, "dnf": 40,
-            "aur": 20,
-            "flatpak": 10,
-            "snap": 5
-        }
-        score += source_priority.get(source.lower(), 0)
-
-        scored_results.append(((name, desc, source), score))
-
-    scored_results.sort(key=lambda x: x[1], reverse=True)
-    top = [pkg for pkg, score in scored_results if score > 0][:limit]
+
+    def scored_packages():
+        for name, desc, source in all_packages:
+            if not is_valid_package(name, desc):
+                continue
+
+            score = score_package(name, desc, source, query, query_tokens, prefix_lengths)
+            if score > 0:
+                yield (name, desc, source), score
+
+    # Top-k selection: O(n log k) and never holds more than `limit` candidates
+    scored_results = heapq.nlargest(limit, scored_packages(), key=itemgetter(1))
+    top = [pkg for pkg, score in scored_results]
     
     logger.info(f"Found {len(top)} top matches from {len(all_packages)} total packages")
-    for i, (pkg_info, score) in enumerate(scored_results[:limit]):
+    for i, (pkg_info, score) in enumerate(scored_results):
         logger.debug(f"Top match #{i+1}: {pkg_info[0]} (score: {score})")
     
     return top
@@ -239,6 +431,8 @@ def github_fallback(query: str) -> None:
     ))
     
     try:
+        import webbrowser  # only needed on this fallback path
+
         url = f"https://github.com/search?q={query.replace(' ', '+')}&type=repositories"
         logger.info(f"Opening GitHub search URL: {url}")
         console.print(f"[blue]Opening GitHub search:[/blue] {url}")
@@ -255,58 +449,133 @@ def github_fallback(query: str) -> None:
             border_style="red"
         ))
 
+# User-facing hints per source and error type, built once at import
+SEARCH_ERROR_MESSAGES = {
+    "aur": {
+        "network": "Cannot connect to AUR servers. Check your internet connection.",
+        "timeout": "AUR search timed out. Try again later.",
+        "generic": "AUR search failed. The service might be temporarily unavailable."
+    },
+    "pacman": {
+        "not_found": "pacman command not found. Install pacman or run on Arch-based system.",
+        "permission": "Permission denied running pacman. Check your user permissions.",
+        "generic": "pacman search failed. Ensure pacman is properly installed."
+    },
+    "flatpak": {
+        "not_found": "flatpak command not found. Install flatpak first.",
+        "no_remotes": "No Flatpak remotes configured. Run: flatpak remote-add --if-not-exists flathub https://flathub.org/repo/flathub.flatpakrepo",
+        "generic": "Flatpak search failed. Ensure Flatpak is properly configured."
+    },
+    "snap": {
+        "not_found": "snap command not found. Install snapd first.",
+        "not_running": "snapd service is not running. Run: sudo systemctl start snapd",
+        "generic": "Snap search failed. Ensure snapd is installed and running."
+    },
+    "apt": {
+        "not_found": "apt-cache command not found. Run on Debian/Ubuntu-based system.",
+        "update_needed": "Package cache is outdated. Run: sudo apt update",
+        "generic": "APT search failed. Update package cache or check APT configuration."
+    },
+    "dnf": {
+        "not_found": "dnf command not found. Run on Fedora/RHEL-based system.",
+        "cache_error": "DNF cache error. Try: sudo dnf clean all && sudo dnf makecache",
+        "generic": "DNF search failed. Check DNF configuration or try clearing cache."
+    }
+}
+
+# Checked in order; the first matching exception type picks the hint
+SEARCH_ERROR_TYPES = (
+    ((NetworkError, ConnectionError), "network"),
+    (TimeoutError, "timeout"),
+    (PackageManagerNotFound, "not_found"),
+    (PermissionError, "permission"),
+)
+
 def handle_search_errors(source_name: str, error: Exception) -> None:
     """Centralized error handling for search operations."""
     PackageHelperLogger.log_exception(logger, f"{source_name} search failed", error)
     
-    error_messages = {
-        "aur": {
-            "network": "Cannot connect to AUR servers. Check your internet connection.",
-            "timeout": "AUR search timed out. Try again later.",
-            "generic": "AUR search failed. The service might be temporarily unavailable."
-        },
-        "pacman": {
-            "not_found": "pacman command not found. Install pacman or run on Arch-based system.",
-            "permission": "Permission denied running pacman. Check your user permissions.",
-            "generic": "pacman search failed. Ensure pacman is properly installed."
-        },
-        "flatpak": {
-            "not_found": "flatpak command not found. Install flatpak first.",
-            "no_remotes": "No Flatpak remotes configured. Run: flatpak remote-add --if-not-exists flathub https://flathub.org/repo/flathub.flatpakrepo",
-            "generic": "Flatpak search failed. Ensure Flatpak is properly configured."
-        },
-        "snap": {
-            "not_found": "snap command not found. Install snapd first.",
-            "not_running": "snapd service is not running. Run: sudo systemctl start snapd",
-            "generic": "Snap search failed. Ensure snapd is installed and running."
-        },
-        "apt": {
-            "not_found": "apt-cache command not found. Run on Debian/Ubuntu-based system.",
-            "update_needed": "Package cache is outdated. Run: sudo apt update",
-            "generic": "APT search failed. Update package cache or check APT configuration."
-        },
-        "dnf": {
-            "not_found": "dnf command not found. Run on Fedora/RHEL-based system.",
-            "cache_error": "DNF cache error. Try: sudo dnf clean all && sudo dnf makecache",
-            "generic": "DNF search failed. Check DNF configuration or try clearing cache."
-        }
-    }
-    
     # Determine specific error type
-    if isinstance(error, (NetworkError, ConnectionError)):
-        error_type = "network"
-    elif isinstance(error, TimeoutError):
-        error_type = "timeout"
-    elif isinstance(error, PackageManagerNotFound):
-        error_type = "not_found"
-    elif isinstance(error, PermissionError):
-        error_type = "permission"
-    else:
-        error_type = "generic"
-    
-    message = error_messages.get(source_name, {}).get(error_type, f"{source_name} search encountered an error.")
+    error_type = next(
+        (key for types, key in SEARCH_ERROR_TYPES if isinstance(error, types)),
+        "generic"
+    )
+    
+    message = SEARCH_ERROR_MESSAGES.get(source_name, {}).get(error_type, f"{source_name} search encountered an error.")
     console.print(f"[yellow]{source_name.upper()}: {message}[/yellow]")
 
+def run_searches(query: str, backends: List[Tuple[str, str, Callable[[str], List[Tuple[str, str, str]]]]]) -> Tuple[List[Tuple[str, str, str]], List[str]]:
+    """Run backend searches concurrently and collect their results.
+    
+    Every backend is either an HTTP request or a package manager subprocess,
+    so they are dispatched on a thread pool and the total wait is the
+    slowest backend rather than the sum of all of them. Results are merged
+    in backend order regardless of completion order, so deduplication and
+    ranking stay deterministic.
+    
+    Args:
+        query: Search query string
+        backends: List of (source, display name, search function) tuples
+        
+    Returns:
+        Tuple[List[Tuple[str, str, str]], List[str]]: (combined results, display names of failed backends)
+    """
+    results_by_source = {}
+    failed_sources = set()
+
+    # Every backend enforces its own timeouts; this overall deadline only
+    # stops one wedged backend from holding back the others' results.
+    deadline = max(TIMEOUTS.get(source, 0) for source, _, _ in backends) + TIMEOUTS['command_check']
+
+    executor = ThreadPoolExecutor(max_workers=len(backends))
+    try:
+        futures = {}
+        for source, label, search_fn in backends:
+            logger.debug(f"Starting {label} search")
+            futures[executor.submit(search_fn, query)] = source
+
+        def collect(future, source):
+            try:
+                results_by_source[source] = future.result()
+                logger.info(f"{source} search returned {len(results_by_source[source])} results")
+            except Exception as e:
+                handle_search_errors(source, e)
+                failed_sources.add(source)
+
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                collect(future, futures[future])
+        except FuturesTimeoutError:
+            for future, source in futures.items():
+                if source in results_by_source or source in failed_sources:
+                    continue
+                if future.done():
+                    # Finished after as_completed's last wait but before its
+                    # deadline check: the result is still usable
+                    collect(future, source)
+                else:
+                    handle_search_errors(source, TimeoutError(
+                        f"{source} search did not finish within {deadline}s",
+                        timeout_duration=deadline,
+                        operation=f"{source} search"
+                    ))
+                    failed_sources.add(source)
+    finally:
+        # Return without waiting for a wedged backend thread; its result is
+        # discarded. concurrent.futures still joins its workers at interpreter
+        # exit, so a stuck backend delays exit until its own timeout fires.
+        executor.shutdown(wait=False)
+
+    results = []
+    search_errors = []
+    for source, label, _ in backends:
+        if source in failed_sources:
+            search_errors.append(label)
+        else:
+            results.extend(results_by_source[source])
+
+    return results, search_errors
+
 def main() -> None:
     """
     Main entrypoint for CLI search + install flow.
@@ -320,7 +589,14 @@ def main() -> None:
     parser.add_argument('--debug', action='store_true', help='Enable debug logging to console')
     parser.add_argument('--log-info', action='store_true', help='Show logging configuration and exit')
     parser.add_argument('--aur', action='store_true', help='Prefer AUR packages over Pacman when both are available')
+    parser.add_argument('--index', type=int, metavar='N', help='Select the Nth match without prompting')
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help='Install without prompting: selects the top match (or --index) and skips confirmation. '
+                             'Also enabled by ARCHPKG_AUTO=1')
     args = parser.parse_args()
+    auto_confirm = args.yes or os.environ.get('ARCHPKG_AUTO') == '1'
+    # Scripted runs get a non-zero exit status on every failure instead of hints to retry
+    non_interactive = auto_confirm or args.index is not None
     
     # Enable debug mode if requested
     if args.debug:
@@ -349,6 +625,7 @@ def main() -> None:
             "- [cyan]archpkg firefox[/cyan] - Search for Firefox\n"
             "- [cyan]archpkg visual studio code[/cyan] - Search for VS Code\n"
             "- [cyan]archpkg --aur firefox[/cyan] - Prefer AUR packages over Pacman\n"
+            "- [cyan]archpkg --yes firefox[/cyan] - Install the top match without prompting\n"
             "- [cyan]archpkg --debug firefox[/cyan] - Search with debug output\n"
             "- [cyan]archpkg --log-info[/cyan] - Show logging configuration\n"
             "- [cyan]archpkg --help[/cyan] - Show help information",
@@ -374,78 +651,30 @@ def main() -> None:
         ))
         return
 
+    query_profile = build_query_profile(query)
     detected = detect_distro()
     console.print(f"\nSearching for '{query}' on [cyan]{detected}[/cyan] platform...\n")
 
-    results = []
-    search_errors = []
+    backends = []
 
     # Search based on detected distribution
     if detected == "arch":
         logger.info("Searching Arch-based repositories (AUR + pacman)")
-        
-        try:
-            logger.debug("Starting AUR search")
-            aur_results = search_aur(query)
-            results.extend(aur_results)
-            logger.info(f"AUR search returned {len(aur_results)} results")
-        except Exception as e:
-            handle_search_errors("aur", e)
-            search_errors.append("AUR")
-            
-        try:
-            logger.debug("Starting pacman search")
-            pacman_results = search_pacman(query) 
-            results.extend(pacman_results)
-            logger.info(f"Pacman search returned {len(pacman_results)} results")
-        except Exception as e:
-            handle_search_errors("pacman", e)
-            search_errors.append("Pacman")
-            
+        backends.append(("aur", "AUR", load_search_backend("aur")))
+        backends.append(("pacman", "Pacman", load_search_backend("pacman")))
     elif detected == "debian":
         logger.info("Searching Debian-based repositories (APT)")
-        
-        try:
-            logger.debug("Starting APT search")
-            apt_results = search_apt(query)
-            results.extend(apt_results)
-            logger.info(f"APT search returned {len(apt_results)} results")
-        except Exception as e:
-            handle_search_errors("apt", e)
-            search_errors.append("APT")
-            
+        backends.append(("apt", "APT", load_search_backend("apt")))
     elif detected == "fedora":
         logger.info("Searching Fedora-based repositories (DNF)")
-        
-        try:
-            logger.debug("Starting DNF search")
-            dnf_results = search_dnf(query)
-            results.extend(dnf_results)
-            logger.info(f"DNF search returned {len(dnf_results)} results")
-        except Exception as e:
-            handle_search_errors("dnf", e)
-            search_errors.append("DNF")
+        backends.append(("dnf", "DNF", load_search_backend("dnf")))
 
     # Universal package managers
     logger.info("Searching universal package managers (Flatpak + Snap)")
-    
-    try:
-        logger.debug("Starting Flatpak search")
-        flatpak_results = search_flatpak(query)
-        results.extend(flatpak_results)
-        logger.info(f"Flatpak search returned {len(flatpak_results)} results")
-    except Exception as e:
-        handle_search_errors("flatpak", e)
-        search_errors.append("Flatpak")
+    backends.append(("flatpak", "Flatpak", load_search_backend("flatpak")))
+    backends.append(("snap", "Snap", load_search_backend("snap")))
 
-    try:
-        logger.debug("Starting Snap search")
-        snap_results = search_snap(query)
-        results.extend(snap_results)
-        logger.info(f"Snap search returned {len(snap_results)} results")
-    except Exception as e:
-        handle_search_errors("snap", e)
-        search_errors.append("Snap")
+    results, search_errors = run_searches(query, backends)
 
     # Show search summary
     if search_errors:
@@ -457,12 +686,14 @@ def main() -> None:
     if not results:
         logger.info("No results found, providing GitHub fallback")
         github_fallback(query)
+        if non_interactive:
+            sys.exit(1)
         return
 
     deduplicated_results = deduplicate_packages(results, prefer_aur=args.aur)
     logger.info(f"After deduplication: {len(deduplicated_results)} unique packages")
 
-    top_matches = get_top_matches(query, deduplicated_results, limit=5)
+    top_matches = get_top_matches(query_profile, deduplicated_results, limit=5)
     if not top_matches:
         logger.warning("No close matches found after scoring")
         console.print(Panel(
@@ -475,9 +706,13 @@ def main() -> None:
             title="No Close Matches",
             border_style="yellow"
         ))
+        if non_interactive:
+            sys.exit(1)
         return
 
-    # Display results
+    # Display results (rich.table is only needed once there is something to show)
+    from rich.table import Table
+
     table = Table(title="Top Matching Packages")
     table.add_column("Index", style="cyan", no_wrap=True)
     table.add_column("Package Name", style="green")
@@ -490,8 +725,15 @@ def main() -> None:
     console.print(table)
     
     try:
-        logger.info("Starting interactive installation flow")
-        choice = input("\nSelect a package to install [1-5 or press Enter to cancel]: ")
+        if args.index is not None:
+            logger.info(f"Package preselected with --index {args.index}")
+            choice = str(args.index)
+        elif auto_confirm:
+            logger.info("Auto-selecting the top match (--yes)")
+            choice = "1"
+        else:
+            logger.info("Starting interactive installation flow")
+            choice = input("\nSelect a package to install [1-5 or press Enter to cancel]: ")
         
         if not choice.strip():
             logger.info("Installation cancelled by user (empty input)")
@@ -503,6 +745,9 @@ def main() -> None:
             logger.debug(f"User selected choice: {choice}")
         except ValueError:
             logger.warning(f"Invalid user input: '{choice}'")
+            if non_interactive:
+                console.print(f"[red]Invalid package index: '{choice}'[/red]")
+                sys.exit(1)
             console.print(Panel(
                 "[red]Invalid input. Please enter a number.[/red]\n\n"
                 "[bold cyan]Valid options:[/bold cyan]\n"
@@ -516,6 +761,14 @@ def main() -> None:
             
         if not (1 <= choice <= len(top_matches)):
             logger.warning(f"Choice {choice} out of range (1-{len(top_matches)})")
+            if non_interactive:
+                console.print(Panel(
+                    f"[red]Choice {choice} is out of range.[/red]\n\n"
+                    f"[bold cyan]Available options:[/bold cyan] 1-{len(top_matches)}",
+                    title="Invalid Choice",
+                    border_style="red"
+                ))
+                sys.exit(1)
             console.print(Panel(
                 f"[red]Choice {choice} is out of range.[/red]\n\n"
                 f"[bold cyan]Available options:[/bold cyan] 1-{len(top_matches)}\n"
@@ -543,17 +796,27 @@ def main() -> None:
                 title="Command Generation Failed",
                 border_style="red"
             ))
+            if non_interactive:
+                sys.exit(1)
             return
             
         logger.info(f"Generated install command: {command}")
         console.print(f"\n[bold green]Install Command:[/bold green] {command}")
-        console.print("[bold yellow]Press Enter to install, or Ctrl+C to cancel...[/bold yellow]")
         
         try:
-            input()
-            logger.info("User confirmed installation, executing command")
+            if auto_confirm:
+                logger.info("Installation confirmed via --yes, executing command")
+            else:
+                console.print("[bold yellow]Press Enter to install, or Ctrl+C to cancel...[/bold yellow]")
+                input()
+                logger.info("User confirmed installation, executing command")
             console.print("[blue]Running install command...[/blue]")
-            exit_code = os.system(command)
+            try:
+                # Exec the installer directly: no intermediate /bin/sh, no shell parsing
+                exit_code = subprocess.run(shlex.split(command), check=False).returncode
+            except FileNotFoundError as e:
+                logger.error(f"Install command executable not found: {e}")
+                exit_code = 127  # same status a shell reports for a missing command
             
             if exit_code != 0:
                 logger.error(f"Installation failed with exit code: {exit_code}")
@@ -567,6 +830,8 @@ def main() -> None:
                     title="Installation Failed",
                     border_style="red"
                 ))
+                if non_interactive:
+                    sys.exit(exit_code)
             else:
                 logger.info(f"Successfully installed package: {pkg}")
                 console.print(f"[bold green]Successfully installed {pkg}![/bold green]")
@@ -2,44 +2,133 @@
 """Command generation module with improved error handling and validation.
 IMPROVEMENTS: Added type hints, standardized exception handling, consistent timeout values."""
 
-import subprocess
-from typing import Optional, List
-from archpkg.config import TIMEOUTS, AUR_HELPERS
+import re
+import shlex
+import shutil
+from functools import lru_cache
+from typing import Optional, List, Tuple
+from archpkg.config import AUR_HELPERS
 from archpkg.exceptions import CommandGenerationError, PackageManagerNotFound, ValidationError
 from archpkg.logging_config import get_logger, PackageHelperLogger
 
 logger = get_logger(__name__)
 
+# Characters that are never valid in a package name (shell metacharacters, path separators)
+INVALID_PACKAGE_CHARS = re.compile(r"[/\\<>|&;`$]")
+
+# Install command per source: (executables to probe in order, command template, error if none available)
+INSTALL_COMMANDS = {
+    'pacman': (
+        ('pacman',),
+        "sudo pacman -S {pkg}",
+        "pacman is not installed or not available in PATH. "
+        "Install pacman or run on an Arch-based system."
+    ),
+    'aur': (
+        AUR_HELPERS,
+        "{executable} -S {pkg}",
+        "No AUR helper found. Install one of the following:\n"
+        "- yay: sudo pacman -S yay\n"
+        "- paru: sudo pacman -S paru\n"
+        "- Or build manually from AUR"
+    ),
+    'flatpak': (
+        ('flatpak',),
+        "flatpak install flathub {pkg}",
+        "Flatpak is not installed. Install it with your system package manager."
+    ),
+    'apt': (
+        ('apt',),
+        "sudo apt install {pkg}",
+        "APT is not available. This command requires a Debian/Ubuntu-based system."
+    ),
+    'dnf': (
+        ('dnf',),
+        "sudo dnf install {pkg}",
+        "DNF is not available. This command requires a Fedora/RHEL-based system."
+    ),
+    'snap': (
+        ('snap',),
+        "sudo snap install {pkg}",
+        "Snap is not installed. Install snapd with your system package manager."
+    ),
+}
+
+# Hints shown when a source's package manager is missing
+INSTALL_SUGGESTIONS = {
+    'pacman': (
+        "This package requires an Arch-based Linux distribution",
+        "Consider using the Flatpak or Snap version if available"
+    ),
+    'aur': (
+        "Install an AUR helper like yay: sudo pacman -S yay",
+        "Or manually build from AUR following the Arch Wiki"
+    ),
+    'flatpak': (
+        "Install Flatpak:",
+        "- Arch: sudo pacman -S flatpak",
+        "- Ubuntu: sudo apt install flatpak",
+        "- Fedora: sudo dnf install flatpak"
+    ),
+    'apt': (
+        "This package requires a Debian/Ubuntu-based system",
+        "Consider using the Flatpak or Snap version if available"
+    ),
+    'dnf': (
+        "This package requires a Fedora/RHEL-based system", 
+        "Consider using the Flatpak or Snap version if available"
+    ),
+    'snap': (
+        "Install Snap:",
+        "- Arch: sudo pacman -S snapd && sudo systemctl enable --now snapd",
+        "- Ubuntu: sudo apt install snapd",
+        "- Fedora: sudo dnf install snapd"
+    )
+}
+DEFAULT_INSTALL_SUGGESTIONS = ("Check your system's package manager documentation",)
+
+@lru_cache(maxsize=None)
 def check_command_availability(command: str) -> bool:
     """Check if a command is available in the system PATH.
     
+    Results are memoized for the lifetime of the process.
+    
     Args:
         command: The command to check
         
     Returns:
         bool: True if command is available, False otherwise
     """
-    logger.debug(f"Checking availability of command: {command}")
+    logger.debug("Checking availability of command: %s", command)
     
-    try:
-        result = subprocess.run([command, '--version'], 
-                              capture_output=True, 
-                              check=True, 
-                              timeout=TIMEOUTS['command_check'])
-        logger.debug(f"Command '{command}' is available (exit code: {result.returncode})")
-        return True
-    except FileNotFoundError:
-        logger.debug(f"Command '{command}' not found in PATH")
-        return False
-    except subprocess.CalledProcessError as e:
-        logger.debug(f"Command '{command}' found but returned error code {e.returncode}")
-        return False
-    except subprocess.TimeoutExpired:
-        logger.warning(f"Command '{command}' check timed out after {TIMEOUTS['command_check']}s")
-        return False
-    except Exception as e:
-        PackageHelperLogger.log_exception(logger, f"Unexpected error checking command '{command}'", e)
+    # A PATH lookup: unlike running '<command> --version' it cannot hang on,
+    # or be misled by the exit status of, the program itself
+    path = shutil.which(command)
+    if path is None:
+        logger.debug("Command '%s' not found in PATH", command)
         return False
+    
+    logger.debug("Command '%s' is available at %s", command, path)
+    return True
+
+@lru_cache(maxsize=None)
+def find_available_executable(executables: Tuple[str, ...]) -> Optional[str]:
+    """Find the first available executable, in order of preference.
+    
+    Memoized per candidate tuple, so once e.g. an AUR helper has been found
+    later lookups return it without walking the candidates again.
+    
+    Args:
+        executables: Candidate commands, most preferred first
+        
+    Returns:
+        Optional[str]: First available command, or None if none is available
+    """
+    for candidate in executables:
+        logger.debug("Checking for executable: %s", candidate)
+        if check_command_availability(candidate):
+            return candidate
+    return None
 
 def validate_package_name(pkg_name: str) -> tuple[bool, str]:
     """Validate package name format.
@@ -50,25 +139,25 @@ def validate_package_name(pkg_name: str) -> tuple[bool, str]:
     Returns:
         tuple[bool, str]: (is_valid, message)
     """
-    logger.debug(f"Validating package name: '{pkg_name}'")
+    logger.debug("Validating package name: '%s'", pkg_name)
     
     if not pkg_name:
         logger.warning("Empty package name provided for validation")
         return False, "Package name cannot be empty"
         
-    # Basic validation - package names shouldn't contain certain characters
-    invalid_chars = ['/', '\\', '<', '>', '|', '&', ';', '`', '$']
-    for char in invalid_chars:
-        if char in pkg_name:
-            logger.warning(f"Package name '{pkg_name}' contains invalid character: '{char}'")
-            return False, f"Package name contains invalid character: '{char}'"
-            
-    # Check length
+    # Check length first: cheap, and bounds the character scan below
     if len(pkg_name) > 100:
-        logger.warning(f"Package name '{pkg_name}' is too long ({len(pkg_name)} characters)")
+        logger.warning("Package name '%s' is too long (%s characters)", pkg_name, len(pkg_name))
         return False, "Package name is too long"
         
-    logger.debug(f"Package name '{pkg_name}' is valid")
+    # Basic validation - package names shouldn't contain certain characters
+    invalid_match = INVALID_PACKAGE_CHARS.search(pkg_name)
+    if invalid_match:
+        char = invalid_match.group()
+        logger.warning("Package name '%s' contains invalid character: '%s'", pkg_name, char)
+        return False, f"Package name contains invalid character: '{char}'"
+            
+    logger.debug("Package name '%s' is valid", pkg_name)
     return True, "Valid package name"
 
 def generate_command(pkg_name: str, source: str) -> Optional[str]:
@@ -85,115 +174,52 @@ def generate_command(pkg_name: str, source: str) -> Optional[str]:
         CommandGenerationError: When command generation fails
         ValidationError: When input validation fails
     """
-    logger.info(f"Generating install command for package '{pkg_name}' from source '{source}'")
+    logger.info("Generating install command for package '%s' from source '%s'", pkg_name, source)
+    
+    # Normalize once; everything below works on the stripped values
+    pkg_name = (pkg_name or "").strip()
+    source = (source or "").strip().lower()  # IMPROVED: Ensure lowercase for consistency
     
     # IMPROVED: Input validation with detailed error messages
-    if not pkg_name or not pkg_name.strip():
+    if not pkg_name:
         logger.error("Empty package name provided to generate_command")
         raise ValidationError("Package name cannot be empty")
         
-    if not source or not source.strip():
+    if not source:
         logger.error("Empty package source provided to generate_command")
         raise ValidationError("Package source cannot be empty")
     
     # Validate package name format
-    is_valid, validation_msg = validate_package_name(pkg_name.strip())
+    is_valid, validation_msg = validate_package_name(pkg_name)
     if not is_valid:
-        logger.error(f"Package name validation failed: {validation_msg}")
+        logger.error("Package name validation failed: %s", validation_msg)
         raise ValidationError(validation_msg)
         
-    pkg_name = pkg_name.strip()
-    source = source.strip().lower()  # IMPROVED: Ensure lowercase for consistency
-    logger.debug(f"Processing package '{pkg_name}' from source '{source}'")
+    logger.debug("Processing package '%s' from source '%s'", pkg_name, source)
     
     # Generate commands based on source
     try:
-        if source == 'pacman':
-            logger.debug("Generating pacman install command")
-            if not check_command_availability('pacman'):
-                logger.error("pacman command not available")
-                raise PackageManagerNotFound(
-                    "pacman is not installed or not available in PATH. "
-                    "Install pacman or run on an Arch-based system."
-                )
-            command = f"sudo pacman -S {pkg_name}"
-            logger.info(f"Generated pacman command: {command}")
-            return command
-            
-        elif source == 'aur':
-            logger.debug("Generating AUR install command")
-            # Check for common AUR helpers in order of preference
-            available_helper = None
-            
-            for helper in AUR_HELPERS:  # IMPROVED: Use config constant
-                logger.debug(f"Checking for AUR helper: {helper}")
-                if check_command_availability(helper):
-                    available_helper = helper
-                    logger.info(f"Found AUR helper: {helper}")
-                    break
-                    
-            if not available_helper:
-                logger.error("No AUR helper found on system")
-                raise PackageManagerNotFound(
-                    "No AUR helper found. Install one of the following:\n"
-                    "- yay: sudo pacman -S yay\n"
-                    "- paru: sudo pacman -S paru\n"
-                    "- Or build manually from AUR"
-                )
-            command = f"{available_helper} -S {pkg_name}"
-            logger.info(f"Generated AUR command: {command}")
-            return command
-            
-        elif source == 'flatpak':
-            logger.debug("Generating Flatpak install command")
-            if not check_command_availability('flatpak'):
-                logger.error("flatpak command not available")
-                raise PackageManagerNotFound(
-                    "Flatpak is not installed. Install it with your system package manager."
-                )
-            command = f"flatpak install flathub {pkg_name}"
-            logger.info(f"Generated Flatpak command: {command}")
-            return command
-            
-        elif source == 'apt':
-            logger.debug("Generating APT install command")
-            if not check_command_availability('apt'):
-                logger.error("apt command not available")
-                raise PackageManagerNotFound(
-                    "APT is not available. This command requires a Debian/Ubuntu-based system."
-                )
-            command = f"sudo apt install {pkg_name}"
-            logger.info(f"Generated APT command: {command}")
-            return command
-            
-        elif source == 'dnf':
-            logger.debug("Generating DNF install command")
-            if not check_command_availability('dnf'):
-                logger.error("dnf command not available")
-                raise PackageManagerNotFound(
-                    "DNF is not available. This command requires a Fedora/RHEL-based system."
-                )
-            command = f"sudo dnf install {pkg_name}"
-            logger.info(f"Generated DNF command: {command}")
-            return command
-            
-        elif source == 'snap':
-            logger.debug("Generating Snap install command")
-            if not check_command_availability('snap'):
-                logger.error("snap command not available")
-                raise PackageManagerNotFound(
-                    "Snap is not installed. Install snapd with your system package manager."
-                )
-            command = f"sudo snap install {pkg_name}"
-            logger.info(f"Generated Snap command: {command}")
-            return command
-            
-        else:
-            logger.error(f"Unsupported package source: '{source}'")
+        entry = INSTALL_COMMANDS.get(source)
+        if entry is None:
+            logger.error("Unsupported package source: '%s'", source)
             raise ValidationError(
                 f"Unsupported package source: '{source}'. "
-                "Supported sources: pacman, aur, flatpak, apt, dnf, snap"
+                f"Supported sources: {', '.join(INSTALL_COMMANDS)}"
             )
+
+        executables, template, missing_message = entry
+        logger.debug("Generating %s install command", source)
+
+        # First available executable wins (AUR helpers are listed in order of preference)
+        executable = find_available_executable(executables)
+
+        if not executable:
+            logger.error("No executable available for source '%s' (tried: %s)", source, ', '.join(executables))
+            raise PackageManagerNotFound(missing_message)
+
+        command = template.format(executable=executable, pkg=shlex.quote(pkg_name))
+        logger.info("Generated %s command: %s", source, command)
+        return command
             
     except (PackageManagerNotFound, ValidationError):
         # Re-raise our specific exceptions
@@ -212,39 +238,8 @@ def get_install_suggestions(source: str) -> List[str]:
     Returns:
         List[str]: List of installation suggestions
     """
-    logger.debug(f"Getting install suggestions for source: {source}")
-    
-    suggestions = {
-        'pacman': [
-            "This package requires an Arch-based Linux distribution",
-            "Consider using the Flatpak or Snap version if available"
-        ],
-        'aur': [
-            "Install an AUR helper like yay: sudo pacman -S yay",
-            "Or manually build from AUR following the Arch Wiki"
-        ],
-        'flatpak': [
-            "Install Flatpak:",
-            "- Arch: sudo pacman -S flatpak",
-            "- Ubuntu: sudo apt install flatpak",
-            "- Fedora: sudo dnf install flatpak"
-        ],
-        'apt': [
-            "This package requires a Debian/Ubuntu-based system",
-            "Consider using the Flatpak or Snap version if available"
-        ],
-        'dnf': [
-            "This package requires a Fedora/RHEL-based system", 
-            "Consider using the Flatpak or Snap version if available"
-        ],
-        'snap': [
-            "Install Snap:",
-            "- Arch: sudo pacman -S snapd && sudo systemctl enable --now snapd",
-            "- Ubuntu: sudo apt install snapd",
-            "- Fedora: sudo dnf install snapd"
-        ]
-    }
+    logger.debug("Getting install suggestions for source: %s", source)
     
-    result = suggestions.get(source.lower(), ["Check your system's package manager documentation"])
-    logger.debug(f"Returning {len(result)} suggestions for source '{source}'")
+    result = list(INSTALL_SUGGESTIONS.get(source.lower(), DEFAULT_INSTALL_SUGGESTIONS))
+    logger.debug("Returning %s suggestions for source '%s'", len(result), source)
     return result
\ No newline at end of file
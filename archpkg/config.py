@@ -1,6 +1,8 @@
 # config.py
 """Configuration constants and settings for the Universal Package Helper CLI."""
 
+from types import MappingProxyType
+
 # Timeout values for different package managers (in seconds)
 TIMEOUTS = {
     'aur': 15,
@@ -12,16 +14,37 @@ TIMEOUTS = {
     'command_check': 5
 }
 
+# On-disk cache of native package manager search results. Entries are
+# invalidated when the package database changes (latest mtime of these paths,
+# including the direct entries of directories) or when they exceed the TTL.
+PACKAGE_DB_PATHS = {
+    'pacman': ['/var/lib/pacman/sync'],
+    'apt': ['/var/cache/apt/pkgcache.bin', '/var/lib/apt/lists'],
+    'dnf': ['/var/cache/dnf']
+}
+SEARCH_CACHE = {
+    'ttl': 600,  # seconds
+    'max_queries': 50  # cached queries per source (one file each), most recent kept
+}
+
 # Keywords used for filtering/scoring
 JUNK_KEYWORDS = ["icon", "dummy", "meta", "symlink", "wrap", "material", "launcher", "unionfs"]
 LOW_PRIORITY_KEYWORDS = ["extension", "plugin", "helper", "daemon", "patch", "theme"]
 BOOST_KEYWORDS = ["editor", "browser", "ide", "official", "gui", "android", "studio", "stable", "canary", "beta"]
 
+# Score bonus per package source (native repositories first)
+SOURCE_PRIORITY = {
+    "pacman": 40, "apt": 40, "dnf": 40,
+    "aur": 20,
+    "flatpak": 10,
+    "snap": 5
+}
+
 # Supported platforms
 SUPPORTED_PLATFORMS = ["arch", "debian", "ubuntu", "linuxmint", "fedora", "manjaro"]
 
-# Distribution mapping
-DISTRO_MAP = {
+# Distribution mapping (read-only: fixed at import time)
+DISTRO_MAP = MappingProxyType({
     "arch": "arch",
     "manjaro": "arch", 
     "endeavouros": "arch",
@@ -37,10 +60,10 @@ DISTRO_MAP = {
     "centos": "fedora", 
     "rocky": "fedora",
     "alma": "fedora"
-}
+})
 
 # AUR helpers in order of preference
-AUR_HELPERS = ['yay', 'paru', 'trizen', 'yaourt']
+AUR_HELPERS = ('yay', 'paru', 'trizen', 'yaourt')
 
 # Logging configuration
 LOGGING_CONFIG = {
@@ -6,6 +6,7 @@ import subprocess
 from typing import List, Tuple
 from archpkg.config import TIMEOUTS
 from archpkg.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError, ValidationError
+from archpkg.cache import load_search_results, store_search_results
 from archpkg.logging_config import get_logger, PackageHelperLogger
 
 logger = get_logger(__name__)
@@ -31,6 +32,10 @@ def search_apt(query: str) -> List[Tuple[str, str, str]]:
     if not query or not query.strip():
         logger.error("Empty search query provided to APT search")
         raise ValidationError("Search query cannot be empty. Please provide a package name to search for.")
+
+    cached_results = load_search_results('apt', query)
+    if cached_results is not None:
+        return cached_results
     
     # Check if apt-cache is available
     logger.debug("Checking APT availability")
@@ -72,6 +77,7 @@ def search_apt(query: str) -> List[Tuple[str, str, str]]:
             
             if "Unable to locate package" in error_msg:
                 logger.info("No packages found (normal result)")
+                store_search_results('apt', query, [])
                 return []  # no packages found, which is normal
             elif "E: Could not open lock file" in error_msg:
                 logger.error("APT cache is locked")
@@ -88,6 +94,7 @@ def search_apt(query: str) -> List[Tuple[str, str, str]]:
         output = result.stdout.strip()
         if not output:
             logger.info("APT search returned empty output")
+            store_search_results('apt', query, [])
             return []
 
         logger.debug("Parsing APT search results")
@@ -108,6 +115,7 @@ def search_apt(query: str) -> List[Tuple[str, str, str]]:
                 logger.debug(f"Found APT package: {name.strip()}")
             
         logger.info(f"APT search completed: {len(packages)} packages found from {lines_processed} lines")
+        store_search_results('apt', query, packages)
         return packages
         
     except subprocess.TimeoutExpired:
@@ -5,6 +5,13 @@ IMPROVEMENTS: Standardized source name to lowercase, used config timeouts, impro
 import requests
 import json
 from typing import List, Tuple
+
+# orjson is an optional speedup (pip install archpkg-helper[fast]); its
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from archpkg.config import TIMEOUTS
 from archpkg.exceptions import NetworkError, TimeoutError, ValidationError, PackageSearchException
 from archpkg.logging_config import get_logger, PackageHelperLogger
@@ -48,7 +55,7 @@ def search_aur(query: str) -> List[Tuple[str, str, str]]:
         
         # Parse JSON response safely
         try:
-            data = response.json()
+            data = json_loads(response.content)
             logger.debug("Successfully parsed AUR API JSON response")
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON response from AUR: {str(e)}")
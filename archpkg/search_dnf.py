@@ -7,6 +7,7 @@ import re
 from typing import List, Tuple
 from archpkg.config import TIMEOUTS
 from archpkg.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError, ValidationError, NetworkError
+from archpkg.cache import load_search_results, store_search_results
 from archpkg.logging_config import get_logger, PackageHelperLogger
 
 logger = get_logger(__name__)
@@ -33,6 +34,10 @@ def search_dnf(query: str) -> List[Tuple[str, str, str]]:
         logger.error("Empty search query provided to DNF search")
         raise ValidationError("Empty search query provided")
 
+    cached_results = load_search_results('dnf', query)
+    if cached_results is not None:
+        return cached_results
+
     # Check if DNF is available and working
     logger.debug("Checking DNF availability")
     try:
@@ -71,6 +76,7 @@ def search_dnf(query: str) -> List[Tuple[str, str, str]]:
         # Handle DNF exit codes
         if result.returncode == 1:  # no matches found
             logger.info("DNF search found no matches (normal result)")
+            store_search_results('dnf', query, [])
             return []
         elif result.returncode != 0:
             error_msg = result.stderr.strip()
@@ -99,6 +105,7 @@ def search_dnf(query: str) -> List[Tuple[str, str, str]]:
         output = result.stdout.strip()
         if not output:
             logger.info("DNF search returned empty output")
+            store_search_results('dnf', query, [])
             return []
 
         logger.debug("Parsing DNF search results")
@@ -137,6 +144,7 @@ def search_dnf(query: str) -> List[Tuple[str, str, str]]:
                         logger.debug(f"Found DNF package: {name}")
 
         logger.info(f"DNF search completed: {len(packages)} packages found from {lines_processed} lines")
+        store_search_results('dnf', query, packages)
         return packages
 
     except subprocess.TimeoutExpired:
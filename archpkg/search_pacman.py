@@ -6,6 +6,7 @@ import subprocess
 from typing import List, Tuple
 from archpkg.config import TIMEOUTS
 from archpkg.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError, ValidationError
+from archpkg.cache import load_search_results, store_search_results
 from archpkg.logging_config import get_logger, PackageHelperLogger
 
 logger = get_logger(__name__)
@@ -31,6 +32,10 @@ def search_pacman(query: str) -> List[Tuple[str, str, str]]:
         logger.error("Empty search query provided to pacman search")
         raise ValidationError("Empty search query provided")
 
+    cached_results = load_search_results('pacman', query)
+    if cached_results is not None:
+        return cached_results
+
     # Check if pacman is available and working
     logger.debug("Checking pacman availability")
     try:
@@ -69,6 +74,7 @@ def search_pacman(query: str) -> List[Tuple[str, str, str]]:
         # Handle common pacman exit codes
         if result.returncode == 1 and not result.stdout.strip():
             logger.info("Pacman search found no matches (normal result)")
+            store_search_results('pacman', query, [])
             return []
         elif result.returncode != 0:
             error_msg = result.stderr.strip()
@@ -86,6 +92,7 @@ def search_pacman(query: str) -> List[Tuple[str, str, str]]:
         output = result.stdout.strip()
         if not output:
             logger.info("Pacman search returned empty output")
+            store_search_results('pacman', query, [])
             return []
 
         logger.debug("Parsing pacman search results")
@@ -117,6 +124,7 @@ def search_pacman(query: str) -> List[Tuple[str, str, str]]:
                 i += 1
 
         logger.info(f"Pacman search completed: {len(results)} packages found from {lines_processed} lines")
+        store_search_results('pacman', query, results)
         return results
 
     except subprocess.TimeoutExpired:
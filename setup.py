@@ -7,10 +7,11 @@ setup(
     install_requires=[
         'requests',
         'rich',
-        'fuzzywuzzy',
-        'python-Levenshtein',
         'distro'
     ],
+    extras_require={
+        'fast': ['orjson']  # faster AUR response parsing
+    },
     entry_points={
         'console_scripts': [
             'archpkg = archpkg.cli:main'  # entry point: archpkg/cli.py -> main()